@@ -6,7 +6,9 @@ class AiService
     "conservative" => { max_bust_prob: 0.15, min_score_to_stay: 25, flip7_threshold: 5 },
     "moderate"     => { max_bust_prob: 0.25, min_score_to_stay: 30, flip7_threshold: 6 },
     "aggressive"   => { max_bust_prob: 0.35, min_score_to_stay: 40, flip7_threshold: 6 }
-  }.freeze
+  }.transform_values { |t| t.merge(behind_max_bust_prob: t[:max_bust_prob] + 0.1).freeze }.freeze
+
+  AVG_CARD_VALUE = 6.5
 
   # Returns { action: "hit"|"stay", action_card: { card_id:, target_player_id: } | nil }
   def self.decide(player, state, difficulty = "moderate")
@@ -23,11 +25,7 @@ class AiService
     current_score = GameLogic.calculate_score(player)
     bust_prob = calculate_bust_probability(player, state[:deck], state[:discard_pile])
 
-    unique_numbers = player[:number_cards]
-      .select { |c| c[:type] == "number" && !c[:value].nil? }
-      .map { |c| c[:value] }
-      .uniq
-    flip7_progress = unique_numbers.size
+    flip7_progress = GameLogic.unique_number_count(player)
 
     opponents = state[:players].reject { |p| p[:id] == player[:id] }
     max_opponent_score = opponents.map { |p| p[:score] }.max || 0
@@ -47,12 +45,11 @@ class AiService
 
     # Be more aggressive when behind
     if is_behind && difficulty != "conservative"
-      should_hit = true if bust_prob < threshold[:max_bust_prob] + 0.1
+      should_hit = true if bust_prob < threshold[:behind_max_bust_prob]
     end
 
     # Go for Flip 7 if close
-    expected_value = calculate_expected_value(player, state[:deck], state[:discard_pile], current_score)
-    if flip7_progress >= 5 && expected_value > current_score * 0.8
+    if flip7_progress >= 5 && calculate_expected_value(bust_prob, current_score) > current_score * 0.8
       should_hit = true
     end
 
@@ -62,24 +59,26 @@ class AiService
   private
 
   def self.calculate_bust_probability(player, deck, discard_pile)
-    drawn_numbers = player[:number_cards]
-      .select { |c| c[:type] == "number" && !c[:value].nil? }
-      .map { |c| c[:value] }
-      .to_set
+    drawn_mask = GameLogic.number_mask(player)
+    number_cards = 0
+    bust_cards = 0
+
+    [ deck, discard_pile ].each do |pile|
+      pile.each do |c|
+        next unless c[:type] == "number" && c[:value]
 
-    remaining = deck + discard_pile
-    number_cards = remaining.select { |c| c[:type] == "number" && !c[:value].nil? }
+        number_cards += 1
+        bust_cards += 1 if drawn_mask[c[:value]] == 1
+      end
+    end
 
-    return 1.0 if number_cards.empty?
+    return 1.0 if number_cards.zero?
 
-    bust_cards = number_cards.count { |c| drawn_numbers.include?(c[:value]) }
-    bust_cards.to_f / number_cards.size
+    bust_cards.to_f / number_cards
   end
 
-  def self.calculate_expected_value(player, deck, discard_pile, current_score)
-    bust_prob = calculate_bust_probability(player, deck, discard_pile)
-    avg_card_value = 6.5
-    new_score_estimate = current_score + avg_card_value
+  def self.calculate_expected_value(bust_prob, current_score)
+    new_score_estimate = current_score + AVG_CARD_VALUE
     (1 - bust_prob) * new_score_estimate
   end
 
@@ -94,8 +93,7 @@ class AiService
       # Target highest scoring opponent
       best = others.max_by do |p|
         score = state[:round_scores]&.dig(p[:id]) || GameLogic.calculate_score(p)
-        unique = p[:number_cards].select { |c| c[:type] == "number" }.map { |c| c[:value] }.uniq.size
-        [ score, unique ]
+        [ score, GameLogic.unique_number_count(p) ]
       end
       best[:id]
     when "flip_three"
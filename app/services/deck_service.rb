@@ -9,7 +9,16 @@ class DeckService
   MODIFIER_VALUES = [ 2, 4, 6, 8, 10 ].freeze
   ACTION_TYPES = %w[freeze flip_three second_chance].freeze
 
+  # Fresh copy of the standard deck, built once and duplicated per call
   def self.create_deck
+    deck_template.map(&:dup)
+  end
+
+  def self.deck_template
+    @deck_template ||= build_deck.each(&:freeze).freeze
+  end
+
+  def self.build_deck
     cards = []
     id = 0
 
@@ -51,7 +60,7 @@ class DeckService
     combined = []
 
     num_decks.times do |deck_num|
-      create_deck.each do |card|
+      deck_template.each do |card|
         combined << card.merge(id: "deck#{deck_num}-#{card[:id]}")
       end
     end
@@ -2,26 +2,32 @@
 # Pure functions for game rule calculations
 
 module GameLogic
+  # Set-bit counts for every number mask (values 0-12 => 13 bits)
+  UNIQUE_COUNTS = Array.new(1 << 13) { |mask| mask.to_s(2).count("1") }.freeze
+
   # Check if drawing new_card would cause a bust (duplicate number)
   # Cannot bust on: action cards, modifier cards, or initial deal
   def self.bust?(player, new_card)
     return false unless new_card[:type] == "number"
 
-    existing_numbers = player[:number_cards]
-      .select { |c| c[:type] == "number" }
-      .map { |c| c[:value] }
+    number_mask(player)[new_card[:value]] == 1
+  end
 
-    existing_numbers.include?(new_card[:value])
+  # Bitmask of the number values a player holds (bit n set => holds an n)
+  def self.number_mask(player)
+    player[:number_cards].reduce(0) do |mask, c|
+      c[:type] == "number" && c[:value] ? mask | (1 << c[:value]) : mask
+    end
   end
 
   # Check if player has 7 unique number cards (Flip 7)
   def self.flip7?(player)
-    unique_numbers = player[:number_cards]
-      .select { |c| c[:type] == "number" && !c[:value].nil? }
-      .map { |c| c[:value] }
-      .uniq
+    unique_number_count(player) >= 7
+  end
 
-    unique_numbers.size >= 7
+  # Count distinct number values held (popcount of the number mask)
+  def self.unique_number_count(player)
+    UNIQUE_COUNTS[number_mask(player)]
   end
 
   # Calculate player's round score
@@ -31,18 +37,19 @@ module GameLogic
   # 4. Add Flip 7 bonus (+15) if applicable
   def self.calculate_score(player)
     # Step 1: Sum number cards
-    score = player[:number_cards]
-      .select { |c| c[:type] == "number" && !c[:value].nil? }
-      .sum { |c| c[:value] }
+    score = player[:number_cards].sum { |c| c[:type] == "number" && c[:value] ? c[:value] : 0 }
 
-    # Step 2: x2 multiplier
-    has_x2 = player[:modifier_cards].any? { |c| c[:modifier_type] == "multiply" && c[:modifier_value] == 2 }
+    # Steps 2-3: x2 multiplier and modifier bonuses, gathered in one walk
+    has_x2 = false
+    bonus = 0
+    player[:modifier_cards].each do |c|
+      case c[:modifier_type]
+      when "multiply" then has_x2 ||= c[:modifier_value] == 2
+      when "add" then bonus += c[:modifier_value] if c[:modifier_value]
+      end
+    end
     score *= 2 if has_x2
-
-    # Step 3: Add modifiers
-    player[:modifier_cards]
-      .select { |c| c[:modifier_type] == "add" && c[:modifier_value] }
-      .each { |c| score += c[:modifier_value] }
+    score += bonus
 
     # Step 4: Flip 7 bonus
     score += 15 if flip7?(player)
@@ -59,8 +66,13 @@ module GameLogic
     }
   end
 
+  # Player is still in the round (not busted, not stayed/frozen)
+  def self.active?(player)
+    player[:is_active] && !player[:has_busted]
+  end
+
   # Get players who are still active (not busted, not stayed/frozen)
   def self.active_players(players)
-    players.select { |p| p[:is_active] && !p[:has_busted] }
+    players.select { |p| active?(p) }
   end
 end
@@ -54,17 +54,13 @@ class GameService
   # --- Round management ---
 
   def start_round
-    # Discard cards from previous round
+    # Discard cards from previous round and reset players for new round
     @state[:players].each do |player|
-      @state[:discard_pile].concat(player[:cards]) if player[:cards].any?
-    end
-
-    # Reset players for new round
-    @state[:players].each do |player|
-      player[:cards] = []
-      player[:number_cards] = []
-      player[:modifier_cards] = []
-      player[:action_cards] = []
+      @state[:discard_pile].concat(player[:cards])
+      player[:cards].clear
+      player[:number_cards].clear
+      player[:modifier_cards].clear
+      player[:action_cards].clear
       player[:is_active] = true
       player[:has_busted] = false
       player[:has_second_chance] = false
@@ -155,7 +151,7 @@ class GameService
       raise "Must specify target player"
     end
 
-    raise "Target not active" unless target && (target[:is_active] && !target[:has_busted])
+    raise "Target not active" unless target && GameLogic.active?(target)
 
     # Remove card from player's hand
     player[:action_cards].reject! { |c| c[:id] == card_id }
@@ -207,8 +203,7 @@ class GameService
       case card[:action_type]
       when "flip_three"
         unless resolving_flip_three
-          other_active = GameLogic.active_players(@state[:players]).reject { |p| p[:id] == player[:id] }
-          if other_active.any?
+          if other_active_players?(player)
             @state[:pending_action_card] = { player_id: player[:id], card_id: card[:id], action_type: "flip_three" }
             # Fall through to add card to hand
           else
@@ -220,8 +215,7 @@ class GameService
         end
 
       when "freeze"
-        other_active = GameLogic.active_players(@state[:players]).reject { |p| p[:id] == player[:id] }
-        if other_active.any?
+        if other_active_players?(player)
           @state[:pending_action_card] = { player_id: player[:id], card_id: card[:id], action_type: "freeze" }
           # Fall through to add card to hand
         else
@@ -303,14 +297,14 @@ class GameService
 
     if has_existing
       # Already has one — give to another player who doesn't
-      others = GameLogic.active_players(@state[:players]).reject do |p|
-        p[:id] == player[:id] ||
-        p[:has_second_chance] ||
-        p[:action_cards].any? { |c| c[:action_type] == "second_chance" }
+      recipient = @state[:players].find do |p|
+        p[:id] != player[:id] &&
+        GameLogic.active?(p) &&
+        !p[:has_second_chance] &&
+        p[:action_cards].none? { |c| c[:action_type] == "second_chance" }
       end
 
-      if others.any?
-        recipient = others.first
+      if recipient
         recipient[:has_second_chance] = true
         recipient[:cards] << card
         reorganize_cards!(recipient)
@@ -337,17 +331,12 @@ class GameService
   end
 
   def move_to_next_player
-    active = GameLogic.active_players(@state[:players])
-    if active.empty?
-      end_round
-      return
-    end
-
+    # Single pass: a full rotation with no active player ends the round
     next_idx = (@state[:current_player_index] + 1) % @state[:players].length
     attempts = 0
     while attempts < @state[:players].length
       p = @state[:players][next_idx]
-      if p[:is_active] && !p[:has_busted]
+      if GameLogic.active?(p)
         @state[:current_player_index] = next_idx
         return
       end
@@ -359,8 +348,7 @@ class GameService
   end
 
   def check_round_end
-    active = GameLogic.active_players(@state[:players])
-    end_round if active.empty?
+    end_round if @state[:players].none? { |p| GameLogic.active?(p) }
   end
 
   def end_round
@@ -461,6 +449,10 @@ class GameService
     player[:action_cards] = organized[:action_cards]
   end
 
+  def other_active_players?(player)
+    @state[:players].any? { |p| p[:id] != player[:id] && GameLogic.active?(p) }
+  end
+
   def find_player!(player_id)
     player = @state[:players].find { |p| p[:id] == player_id }
     raise "Player not found: #{player_id}" unless player
@@ -468,7 +460,7 @@ class GameService
   end
 
   def validate_can_act!(player)
-    raise "Player not active" unless player[:is_active] && !player[:has_busted]
+    raise "Player not active" unless GameLogic.active?(player)
 
     if @state[:pending_action_card] && @state[:pending_action_card][:player_id] == player[:id]
       raise "Must resolve pending action card first"